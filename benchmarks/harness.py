@@ -0,0 +1,140 @@
+# tron/benchmarks/harness.py
+
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# engine modules import each other by bare name (e.g. `from registry import registry`)
+for sub in ("engine", "models/regression"):
+    path = str(ROOT / sub)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+def timeIt(fn, setup=None, repeat=5, warmup=1):
+    """
+    Run fn warmup + repeat times; return per-run wall times in seconds.
+    If setup is given, fn receives its return value and setup is not timed.
+    """
+    samples = []
+    for i in range(warmup + repeat):
+        args = (setup(),) if setup else ()
+        start = time.perf_counter()
+        fn(*args)
+        elapsed = time.perf_counter() - start
+        if i >= warmup:
+            samples.append(elapsed)
+    return samples
+
+
+class BenchResults:
+    """
+    Collects benchmark measurements and serializes them to JSON.
+    Each result is keyed by name so runs can be diffed against a baseline.
+    """
+
+    def __init__(self):
+        self.results = []
+        self.meta = {
+            "timestamp": time.time(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpuCount": os.cpu_count()
+        }
+
+    def add(self, name, metric, value, unit, better="lower", samples=None, **params):
+        entry = {
+            "name": name,
+            "metric": metric,
+            "value": value,
+            "unit": unit,
+            "better": better,
+            "params": params
+        }
+        if samples:
+            entry["samples"] = samples
+            entry["stdev"] = statistics.stdev(samples) if len(samples) > 1 else 0.0
+        self.results.append(entry)
+        return entry
+
+    def toDict(self):
+        return {"meta": self.meta, "results": self.results}
+
+    def save(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.toDict(), f, indent=2)
+
+
+def loadResults(path):
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def compare(current, baseline, tolerance=0.10):
+    """
+    Compare two result dicts by benchmark name.
+
+    Returns {"rows", "missing", "added"}. Each row carries the relative change,
+    where a positive `change` is always an improvement regardless of metric
+    direction, and is flagged as a regression when worse by more than tolerance.
+    `missing` lists baseline benchmarks with no current result (restricted to
+    the suites the current run covered); `added` lists new benchmark names.
+
+    Raises ValueError when exactly one of the runs had profiler hooks enabled,
+    since the hook overhead would show up as a change.
+    """
+    currentProfiled = current["meta"].get("profiled", False)
+    baselineProfiled = baseline["meta"].get("profiled", False)
+    if currentProfiled != baselineProfiled:
+        raise ValueError(
+            f"Profiler state differs (current: {currentProfiled}, baseline: {baselineProfiled}); "
+            "timings are not comparable"
+        )
+
+    base = {r["name"]: r for r in baseline["results"]}
+    names = {r["name"] for r in current["results"]}
+    suites = current["meta"].get("suites")
+
+    rows = []
+    for result in current["results"]:
+        ref = base.get(result["name"])
+        if ref is None:
+            continue
+        rows.append(_compareRow(result, ref, tolerance))
+
+    missing = [
+        name for name in base
+        if name not in names and (suites is None or name.split("/")[0] in suites)
+    ]
+    added = [name for name in names if name not in base]
+    return {"rows": rows, "missing": missing, "added": sorted(added)}
+
+
+def _compareRow(result, ref, tolerance):
+    if ref["value"]:
+        ratio = result["value"] / ref["value"]
+        change = ratio - 1.0 if result["better"] == "higher" else 1.0 - ratio
+    elif result["value"] == ref["value"]:
+        change = 0.0
+    else:
+        # Zero baseline: any movement is an unbounded change in its direction
+        improved = (result["value"] > 0) == (result["better"] == "higher")
+        change = float("inf") if improved else float("-inf")
+    return {
+        "name": result["name"],
+        "metric": result["metric"],
+        "unit": result["unit"],
+        "baseline": ref["value"],
+        "current": result["value"],
+        "change": change,
+        "regression": change < -tolerance
+    }
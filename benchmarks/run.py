@@ -0,0 +1,296 @@
+# tron/benchmarks/run.py
+"""
+TRON benchmark suite.
+
+    python benchmarks/run.py                          # full run, writes bench_results.json
+    python benchmarks/run.py --quick --only pulse     # small sizes, one suite
+    python benchmarks/run.py --save-baseline          # record benchmarks/baseline.json
+    python benchmarks/run.py --baseline benchmarks/baseline.json --tolerance 0.15
+
+With --baseline the process exits non-zero when any benchmark regresses
+by more than the tolerance or a baseline benchmark is missing. Runs with
+and without --profile are never compared against each other.
+"""
+
+import argparse
+import copy
+import gc
+import random
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+from harness import BenchResults, compare, loadResults, timeIt
+
+from Node import Node
+from noderoot import NodeRoot
+from registry import TronRegistry
+from profiler import profiler
+from linearRegression import LinearRegression
+from logisticRegression import LogisticRegression
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+SIZES = {
+    "full": {
+        "fieldSizes": [100, 1000, 5000],
+        "registrySizes": [50, 100, 1000],
+        "fitRows": [100, 1000, 10000],
+        "fitFeatures": [4, 16, 64],
+        "memoryCount": 5000
+    },
+    "quick": {
+        "fieldSizes": [100, 500],
+        "registrySizes": [50, 100],
+        "fitRows": [100, 1000],
+        "fitFeatures": [4, 16],
+        "memoryCount": 1000
+    }
+}
+
+
+def buildField(size, fanOut=4, seed=0):
+    """
+    Random field of `size` nodes, each with `fanOut` outgoing roots.
+    Threshold 0 makes every node fire every tick, so throughput is stable.
+    """
+    rng = random.Random(seed)
+    nodes = [Node(internalState=1.0, activationThreshold=0.0) for _ in range(size)]
+    for node in nodes:
+        for target in rng.sample(nodes, fanOut):
+            NodeRoot(node, target, weight=rng.uniform(0.1, 1.0))
+    return nodes
+
+
+def tickField(nodes):
+    with profiler.tick():
+        for node in nodes:
+            pulse = node.emitPulse()
+            if pulse is not None:
+                for root in node.outgoingRoots:
+                    root.propagate(pulse)
+
+
+def benchPulse(results, sizes, repeat, ticks=5, fanOut=4):
+    for size in sizes:
+        nodes = buildField(size, fanOut=fanOut)
+
+        def run():
+            for _ in range(ticks):
+                tickField(nodes)
+
+        samples = timeIt(run, repeat=repeat)
+        best = min(samples)
+        pulses = size * fanOut * ticks
+        results.add(
+            f"pulse/throughput/nodes={size}", "pulsesPerSec", pulses / best, "pulses/s",
+            better="higher", samples=samples, nodes=size, fanOut=fanOut, ticks=ticks
+        )
+        results.add(
+            f"pulse/tick/nodes={size}", "tickTime", best / ticks, "s",
+            nodes=size, fanOut=fanOut
+        )
+
+
+def benchRegistry(results, sizes, repeat, batch=50):
+    """
+    Register and update rates against registries holding `size` entries.
+    Updates touch `batch` existing labels, so every size must be >= batch.
+    """
+    with tempfile.TemporaryDirectory(prefix="tron-bench-") as tmpdir:
+        tmp = Path(tmpdir)
+        for size in sizes:
+            if size < batch:
+                raise ValueError(f"Registry size {size} is smaller than the update batch ({batch})")
+
+            # Seed once, then hand each sample a fresh copy persisted to disk
+            seed = TronRegistry(path=tmp / f"seed-{size}.json")
+            for i in range(size):
+                seed.register(f"seed-{i}", state=i)
+
+            def prefilled():
+                reg = TronRegistry(path=tmp / f"registry-{size}.json")
+                reg.registry = copy.deepcopy(seed.registry)
+                reg._save()
+                return reg
+
+            def registerBatch(reg):
+                for i in range(batch):
+                    reg.register(f"bench-{i}", state=i)
+
+            samples = timeIt(registerBatch, setup=prefilled, repeat=repeat)
+            results.add(
+                f"registry/register/size={size}", "registersPerSec", batch / min(samples), "ops/s",
+                better="higher", samples=samples, size=size, batch=batch
+            )
+
+            # Spread the updated labels across the whole registry
+            labels = [f"seed-{i * size // batch}" for i in range(batch)]
+
+            def updateBatch(reg):
+                for i, label in enumerate(labels):
+                    reg.updateState(label, i)
+
+            samples = timeIt(updateBatch, setup=prefilled, repeat=repeat)
+            results.add(
+                f"registry/update/size={size}", "updatesPerSec", batch / min(samples), "ops/s",
+                better="higher", samples=samples, size=size, batch=batch
+            )
+
+
+def benchFit(results, rowsList, featuresList, repeat, epochs=200):
+    rng = np.random.default_rng(0)
+    for rows in rowsList:
+        for features in featuresList:
+            X = rng.normal(size=(rows, features))
+            coef = rng.normal(size=features)
+            yLin = X @ coef + rng.normal(scale=0.1, size=rows)
+            yLog = (yLin > 0).astype(float)
+
+            for name, cls, y in (
+                ("linear", LinearRegression, yLin),
+                ("logistic", LogisticRegression, yLog)
+            ):
+                # tolerance=0 pins the epoch count so timings are comparable
+                samples = timeIt(
+                    lambda model: model.fit(X, y),
+                    setup=lambda: cls(epochs=epochs, tolerance=0.0, label=f"bench-{name}"),
+                    repeat=repeat
+                )
+                results.add(
+                    f"fit/{name}/rows={rows}/features={features}", "fitTime", min(samples), "s",
+                    samples=samples, rows=rows, features=features, epochs=epochs
+                )
+
+
+def measureAllocated(build):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return after - before
+
+
+def benchMemory(results, count):
+    nodeBytes = measureAllocated(lambda: [Node(internalState=1.0) for _ in range(count)])
+    results.add(
+        "memory/node", "bytesPerNode", nodeBytes / count, "bytes", count=count
+    )
+
+    nodes = [Node(internalState=1.0) for _ in range(count)]
+    rootBytes = measureAllocated(
+        lambda: [NodeRoot(nodes[i], nodes[(i + 1) % count]) for i in range(count)]
+    )
+    results.add(
+        "memory/root", "bytesPerRoot", rootBytes / count, "bytes", count=count
+    )
+
+    # Growth from logging: one propagate() adds an activityLog and a traceLog entry
+    roots = [root for node in nodes for root in node.outgoingRoots]
+    pulseBytes = measureAllocated(lambda: [root.propagate(1.0) for root in roots])
+    results.add(
+        "memory/pulse", "bytesPerPulse", pulseBytes / len(roots), "bytes", count=len(roots)
+    )
+
+
+SUITES = ("pulse", "registry", "fit", "memory")
+
+
+def runSuites(only, quick, repeat):
+    sizes = SIZES["quick" if quick else "full"]
+    results = BenchResults()
+    results.meta["mode"] = "quick" if quick else "full"
+    results.meta["repeat"] = repeat
+    results.meta["suites"] = [suite for suite in SUITES if suite in only]
+    results.meta["profiled"] = profiler.enabled
+
+    runners = {
+        "pulse": lambda: benchPulse(results, sizes["fieldSizes"], repeat),
+        "registry": lambda: benchRegistry(results, sizes["registrySizes"], repeat),
+        "fit": lambda: benchFit(results, sizes["fitRows"], sizes["fitFeatures"], repeat),
+        "memory": lambda: benchMemory(results, sizes["memoryCount"])
+    }
+    profiles = {}
+    for suite in results.meta["suites"]:
+        profiler.reset()
+        runners[suite]()
+        if profiler.enabled:
+            profiles[suite] = profiler.snapshot()
+    if profiles:
+        results.meta["profile"] = profiles
+    return results
+
+
+def printResults(results):
+    for r in results.results:
+        print(f"{r['name']:<45} {r['value']:>14.6g} {r['unit']}")
+
+
+def printComparison(comparison, tolerance):
+    rows = comparison["rows"]
+    for row in rows:
+        flag = "REGRESSION" if row["regression"] else ""
+        print(
+            f"{row['name']:<45} {row['baseline']:>12.6g} -> {row['current']:>12.6g} "
+            f"{row['change']:+8.1%} {flag}"
+        )
+    for name in comparison["missing"]:
+        print(f"{name:<45} {'missing from current run':>40} MISSING")
+    for name in comparison["added"]:
+        print(f"{name:<45} {'not in baseline':>40} NEW")
+
+    regressions = [row for row in rows if row["regression"]]
+    print(
+        f"\n{len(rows)} compared, {len(regressions)} regressed beyond {tolerance:.0%}, "
+        f"{len(comparison['missing'])} missing, {len(comparison['added'])} new"
+    )
+    return bool(regressions or comparison["missing"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="TRON benchmark suite")
+    parser.add_argument("--only", nargs="+", choices=SUITES, default=list(SUITES))
+    parser.add_argument("--quick", action="store_true", help="smaller problem sizes")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--baseline", help="compare against this results file")
+    parser.add_argument("--save-baseline", action="store_true", help=f"also write {DEFAULT_BASELINE.name}")
+    parser.add_argument("--tolerance", type=float, default=0.10)
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="enable profiler hooks and record per-suite counters (timings then include hook overhead)"
+    )
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        profiler.enable()
+
+    results = runSuites(args.only, args.quick, args.repeat)
+
+    printResults(results)
+    results.save(args.output)
+    print(f"\nResults written to {args.output}")
+    if args.save_baseline:
+        results.save(DEFAULT_BASELINE)
+        print(f"Baseline written to {DEFAULT_BASELINE}")
+
+    if args.baseline:
+        print(f"\nComparing against {args.baseline}\n")
+        try:
+            comparison = compare(results.toDict(), loadResults(args.baseline), args.tolerance)
+        except ValueError as e:
+            print(f"Cannot compare: {e}")
+            return 2
+        if printComparison(comparison, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,7 @@ import numpy as np
 from types import FunctionType
 
 from registry import registry  
+from profiler import profiler
 
 class Node:
     """
@@ -72,6 +73,9 @@ class Node:
             'value': signal
         })
 
+        if profiler.enabled:
+            profiler.count("pulsesDelivered")
+
     def shouldFire(self):
         return self.activationFn(self.nodalActivity)
 
@@ -79,6 +83,8 @@ class Node:
         if self.shouldFire():
             pulseValue = self.computePulseValue()
             self.resetActivity()
+            if profiler.enabled:
+                profiler.count("nodesFired")
             return pulseValue
         return None
 
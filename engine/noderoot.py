@@ -4,6 +4,8 @@ import uuid
 import time
 from types import FunctionType
 
+from profiler import profiler
+
 class NodeRoot:
     """
     TRON NodeRoot: The cognitive artery of the TRON field.
@@ -78,6 +80,8 @@ class NodeRoot:
         Send a signal from source to target node.
         """
         if not self.enabled:
+            if profiler.enabled:
+                profiler.count("pulsesBlocked")
             return
 
         adjusted = self._computePulse(signalStrength)
@@ -0,0 +1,92 @@
+# tron/engine/profiler.py
+
+import os
+import time
+from contextlib import contextmanager, nullcontext
+
+_NULL_TIMER = nullcontext()
+
+
+class TronProfiler:
+    """
+    Lightweight counters and timers for the TRON hot paths.
+
+    Disabled by default; enable with TRON_PROFILE=1 or profiler.enable().
+    When disabled, counter hooks cost a single attribute check and timer()
+    costs one method call returning a shared no-op context, so it is safe
+    to leave the instrumentation in place in production.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.reset()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        self.counters = {}
+        self.timers = {}
+
+    def count(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record(self, name, elapsed):
+        stats = self.timers.get(name)
+        if stats is None:
+            self.timers[name] = {
+                "count": 1,
+                "total": elapsed,
+                "min": elapsed,
+                "max": elapsed
+            }
+            return
+        stats["count"] += 1
+        stats["total"] += elapsed
+        if elapsed < stats["min"]:
+            stats["min"] = elapsed
+        if elapsed > stats["max"]:
+            stats["max"] = elapsed
+
+    def timer(self, name):
+        """
+        Time the enclosed block under `name` (e.g. "tick").
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return self._timed(name)
+
+    @contextmanager
+    def _timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def tick(self):
+        """
+        Per-tick timer; wrap one field tick / propagation sweep with it.
+        """
+        return self.timer("tick")
+
+    def snapshot(self):
+        timers = {}
+        for name, stats in self.timers.items():
+            timers[name] = dict(stats, mean=stats["total"] / stats["count"])
+        return {
+            "enabled": self.enabled,
+            "counters": dict(self.counters),
+            "timers": timers
+        }
+
+    def __repr__(self):
+        state = "on" if self.enabled else "off"
+        return f"<TronProfiler {state} | counters: {len(self.counters)} | timers: {len(self.timers)}>"
+
+
+# Singleton
+profiler = TronProfiler(enabled=os.environ.get("TRON_PROFILE", "") not in ("", "0"))
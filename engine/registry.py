@@ -9,6 +9,8 @@ import rich
 from rich.console import Console
 from rich.table import Table
 
+from profiler import profiler
+
 REGISTRY_PATH = Path(".tron_registry.json")
 console = Console()
 
@@ -30,8 +32,9 @@ class TronRegistry:
             self.registry = {}
 
     def _save(self):
-        with open(self.path, "w") as f:
-            json.dump(self.registry, f, indent=2)
+        with profiler.timer("registrySave"):
+            with open(self.path, "w") as f:
+                json.dump(self.registry, f, indent=2)
 
     def register(self, label, state=None, origin="user", reason="init", owner="unknown", nodalType="general"):
         """
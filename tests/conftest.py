@@ -0,0 +1,12 @@
+# tron/tests/conftest.py
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# engine modules import each other by bare name (e.g. `from registry import registry`)
+for sub in ("engine", "benchmarks"):
+    path = str(ROOT / sub)
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,85 @@
+# tron/tests/test_harness.py
+
+import math
+
+import pytest
+
+from harness import compare
+
+
+def results(entries, profiled=False, suites=None):
+    meta = {"profiled": profiled}
+    if suites is not None:
+        meta["suites"] = suites
+    return {
+        "meta": meta,
+        "results": [
+            {"name": name, "metric": "m", "value": value, "unit": "u", "better": better}
+            for name, value, better in entries
+        ]
+    }
+
+
+def rowsByName(comparison):
+    return {row["name"]: row for row in comparison["rows"]}
+
+
+def test_higher_is_better_sign():
+    baseline = results([("pulse/a", 100.0, "higher"), ("pulse/b", 100.0, "higher")])
+    current = results([("pulse/a", 120.0, "higher"), ("pulse/b", 80.0, "higher")])
+    rows = rowsByName(compare(current, baseline, tolerance=0.10))
+
+    assert rows["pulse/a"]["change"] == pytest.approx(0.20)
+    assert not rows["pulse/a"]["regression"]
+    assert rows["pulse/b"]["change"] == pytest.approx(-0.20)
+    assert rows["pulse/b"]["regression"]
+
+
+def test_lower_is_better_sign():
+    baseline = results([("fit/a", 1.0, "lower"), ("fit/b", 1.0, "lower")])
+    current = results([("fit/a", 0.8, "lower"), ("fit/b", 1.2, "lower")])
+    rows = rowsByName(compare(current, baseline, tolerance=0.10))
+
+    assert rows["fit/a"]["change"] == pytest.approx(0.20)
+    assert not rows["fit/a"]["regression"]
+    assert rows["fit/b"]["change"] == pytest.approx(-0.20)
+    assert rows["fit/b"]["regression"]
+
+
+def test_within_tolerance_is_not_regression():
+    baseline = results([("fit/a", 1.0, "lower")])
+    current = results([("fit/a", 1.05, "lower")])
+    assert not compare(current, baseline, tolerance=0.10)["rows"][0]["regression"]
+
+
+def test_zero_baseline_is_compared():
+    baseline = results([("memory/a", 0.0, "lower"), ("memory/b", 0.0, "lower")])
+    current = results([("memory/a", 0.0, "lower"), ("memory/b", 10.0, "lower")])
+    rows = rowsByName(compare(current, baseline))
+
+    assert rows["memory/a"]["change"] == 0.0
+    assert not rows["memory/a"]["regression"]
+    assert math.isinf(rows["memory/b"]["change"]) and rows["memory/b"]["change"] < 0
+    assert rows["memory/b"]["regression"]
+
+
+def test_missing_and_added_names_reported():
+    baseline = results([("pulse/a", 1.0, "higher"), ("pulse/old", 1.0, "higher")])
+    current = results([("pulse/a", 1.0, "higher"), ("pulse/new", 1.0, "higher")])
+    comparison = compare(current, baseline)
+
+    assert comparison["missing"] == ["pulse/old"]
+    assert comparison["added"] == ["pulse/new"]
+
+
+def test_missing_limited_to_suites_that_ran():
+    baseline = results([("pulse/a", 1.0, "higher"), ("fit/a", 1.0, "lower")])
+    current = results([("pulse/a", 1.0, "higher")], suites=["pulse"])
+    assert compare(current, baseline)["missing"] == []
+
+
+def test_profiled_mismatch_refused():
+    baseline = results([("pulse/a", 1.0, "higher")], profiled=False)
+    current = results([("pulse/a", 1.0, "higher")], profiled=True)
+    with pytest.raises(ValueError):
+        compare(current, baseline)
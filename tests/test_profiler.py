@@ -0,0 +1,53 @@
+# tron/tests/test_profiler.py
+
+from profiler import TronProfiler
+
+
+def test_disabled_timer_records_nothing():
+    profiler = TronProfiler(enabled=False)
+    with profiler.timer("tick"):
+        pass
+    with profiler.tick():
+        pass
+    assert profiler.snapshot()["timers"] == {}
+
+
+def test_count_accumulates_per_name():
+    profiler = TronProfiler(enabled=True)
+    profiler.count("pulsesDelivered")
+    profiler.count("pulsesDelivered", 4)
+    profiler.count("nodesFired")
+    assert profiler.snapshot()["counters"] == {"pulsesDelivered": 5, "nodesFired": 1}
+
+
+def test_record_aggregates_count_total_min_max_mean():
+    profiler = TronProfiler(enabled=True)
+    for elapsed in (0.3, 0.1, 0.2):
+        profiler.record("tick", elapsed)
+    stats = profiler.snapshot()["timers"]["tick"]
+    assert stats["count"] == 3
+    assert stats["total"] == 0.3 + 0.1 + 0.2
+    assert stats["min"] == 0.1
+    assert stats["max"] == 0.3
+    assert stats["mean"] == stats["total"] / 3
+
+
+def test_enabled_timer_records_block():
+    profiler = TronProfiler(enabled=True)
+    with profiler.tick():
+        pass
+    stats = profiler.snapshot()["timers"]["tick"]
+    assert stats["count"] == 1
+    assert stats["total"] >= 0.0
+
+
+def test_snapshot_is_detached_and_reset_clears():
+    profiler = TronProfiler(enabled=True)
+    profiler.count("nodesFired")
+    snap = profiler.snapshot()
+    profiler.count("nodesFired")
+    assert snap["counters"] == {"nodesFired": 1}
+
+    profiler.reset()
+    assert profiler.snapshot()["counters"] == {}
+    assert profiler.snapshot()["timers"] == {}